@@ -28,6 +28,10 @@ AUTH_INTERFACE = plugin.AUTH_INTERFACE
 PLUGIN_NAMESPACE = 'keystoneclient.auth.plugin'
 IDENTITY_AUTH_HEADER_NAME = 'X-Auth-Token'
 
+# NOTE: constructing a stevedore DriverManager rescans the installed entry
+# points, so successfully resolved plugin classes are remembered by name.
+_PLUGIN_CACHE = {}
+
 
 @removals.remove(
     message='keystoneclient auth plugins are deprecated. Use keystoneauth.',
@@ -83,6 +87,11 @@ def get_plugin_class(name):
     :raises keystoneclient.exceptions.NoMatchingPlugin: if a plugin cannot be
                                                         created.
     """
+    try:
+        return _PLUGIN_CACHE[name]
+    except KeyError:
+        pass
+
     try:
         mgr = stevedore.DriverManager(namespace=PLUGIN_NAMESPACE,
                                       name=name,
@@ -90,6 +99,7 @@ def get_plugin_class(name):
     except RuntimeError:
         raise exceptions.NoMatchingPlugin(name)
 
+    _PLUGIN_CACHE[name] = mgr.driver
     return mgr.driver
 
 
@@ -256,6 +266,29 @@ class BaseAuthPlugin(object):
         """
         return []
 
+    @classmethod
+    def get_options_cached(cls):
+        """Return the result of get_options, computing it once per class.
+
+        The argparse and config loading helpers call this rather than
+        get_options so that the option list is only built on first use.
+        Plugins overriding get_options should return a new list each time and
+        callers of this function must not modify the list they are given.
+
+        :returns: A list of Param objects describing available plugin
+                  parameters.
+        :rtype: List
+        """
+        # NOTE: look in the class's own __dict__ so that a subclass does not
+        # pick up the options cached for its parent.
+        options = cls.__dict__.get('_options_cache')
+
+        if options is None:
+            options = cls.get_options()
+            cls._options_cache = options
+
+        return options
+
     @classmethod
     def load_from_options(cls, **kwargs):
         """Create a plugin from the arguments retrieved from get_options.
@@ -282,7 +315,7 @@ class BaseAuthPlugin(object):
         # possible to oslo_config such that when available we should be able to
         # transition.
 
-        for opt in cls.get_options():
+        for opt in cls.get_options_cached():
             args = []
             envs = []
 
@@ -325,7 +358,7 @@ class BaseAuthPlugin(object):
         :type conf: oslo_config.cfg.ConfigOpts
         :param string group: The group name that options should be read from.
         """
-        plugin_opts = cls.get_options()
+        plugin_opts = cls.get_options_cached()
         conf.register_opts(plugin_opts, group=group)
 
     @classmethod
@@ -363,7 +396,7 @@ class BaseAuthPlugin(object):
         :returns: An authentication Plugin.
         :rtype: :py:class:`keystoneclient.auth.BaseAuthPlugin`
         """
-        plugin_opts = cls.get_options()
+        plugin_opts = cls.get_options_cached()
 
         for opt in plugin_opts:
             val = getter(opt)
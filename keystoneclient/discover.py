@@ -14,18 +14,19 @@ import warnings
 
 from debtcollector import removals
 from keystoneauth1 import plugin
+from oslo_utils import importutils
 from positional import positional
 
 from keystoneclient import _discover
 from keystoneclient import exceptions
 from keystoneclient.i18n import _
 from keystoneclient import session as client_session
-from keystoneclient.v2_0 import client as v2_client
-from keystoneclient.v3 import client as v3_client
 
 
-_CLIENT_VERSIONS = {2: v2_client.Client,
-                    3: v3_client.Client}
+# NOTE: the version specific clients pull in all of their managers so they
+# are only imported once discovery has picked the one that is required.
+_CLIENT_VERSIONS = {2: 'keystoneclient.v2_0.client.Client',
+                    3: 'keystoneclient.v3.client.Client'}
 
 
 # functions needed from the private file that can be made public
@@ -288,12 +289,14 @@ class Discover(_discover.Discover):
     def _create_client(self, version_data, **kwargs):
         # Get the client for the version requested that was returned
         try:
-            client_class = _CLIENT_VERSIONS[version_data['version'][0]]
+            client_path = _CLIENT_VERSIONS[version_data['version'][0]]
         except KeyError:
             version = '.'.join(str(v) for v in version_data['version'])
             msg = _('No client available for version: %s') % version
             raise exceptions.DiscoveryFailure(msg)
 
+        client_class = importutils.import_class(client_path)
+
         # kwargs should take priority over stored kwargs.
         for k, v in self._client_kwargs.items():
             kwargs.setdefault(k, v)
@@ -10,7 +10,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import uuid
+
+import mock
+
 from keystoneclient import auth
+from keystoneclient.auth import base
 from keystoneclient.auth import identity
 from keystoneclient.tests.unit.auth import utils
 
@@ -36,3 +41,19 @@ class AuthTests(utils.TestCase):
         self.assertIs(plugins['token'], identity.Token)
         self.assertIs(plugins['v2token'], identity.V2Token)
         self.assertIs(plugins['v3token'], identity.V3Token)
+
+    @mock.patch('stevedore.DriverManager')
+    def test_plugin_class_is_cached(self, m):
+        m.return_value = utils.MockManager(utils.MockPlugin)
+        name = uuid.uuid4().hex
+        self.addCleanup(base._PLUGIN_CACHE.pop, name, None)
+
+        with self.deprecations.expect_deprecations_here():
+            first = auth.get_plugin_class(name)
+            second = auth.get_plugin_class(name)
+
+        self.assertIs(utils.MockPlugin, first)
+        self.assertIs(first, second)
+        m.assert_called_once_with(namespace=base.PLUGIN_NAMESPACE,
+                                  name=name,
+                                  invoke_on_load=False)
@@ -12,6 +12,7 @@
 
 import uuid
 
+import mock
 
 from keystoneclient.tests.unit.auth import utils
 
@@ -44,3 +45,22 @@ class TestOtherLoading(utils.TestCase):
 
         # check that additional kwargs get passed through
         self.assertEqual(val, p['other'])
+
+    def test_options_cached_per_class(self):
+        class CachedPlugin(utils.MockPlugin):
+            pass
+
+        class CachedSubPlugin(CachedPlugin):
+            pass
+
+        with mock.patch.object(CachedPlugin, 'get_options',
+                               wraps=CachedPlugin.get_options) as m:
+            first = CachedPlugin.get_options_cached()
+            second = CachedPlugin.get_options_cached()
+
+        self.assertIs(first, second)
+        self.assertEqual(1, m.call_count)
+
+        sub_opts = CachedSubPlugin.get_options_cached()
+        self.assertIsNot(first, sub_opts)
+        self.assertEqual([o.name for o in first], [o.name for o in sub_opts])